@@ -0,0 +1,109 @@
+"""End-to-end timings of the integration against the local mock cloud.
+
+Run with ``pytest benchmarks`` (needs pytest-homeassistant-custom-component,
+see the ``bench`` dependency group); results are printed as a table at the end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.teleco_daisy.api import AsyncTelecoDaisy
+from custom_components.teleco_daisy.const import DOMAIN
+from mock_cloud import MockDaisyCloud
+
+DEVICE_COUNTS = [10, 100, 1000]
+DEVICES_PER_INSTALLATION = 25
+LATENCY = 0.02
+ROUNDS = 5
+
+# the rate limiter would otherwise dominate every number at 1000 devices
+OPTIONS = {"rate_limit": 10_000, "rate_burst": 10_000}
+
+
+@pytest.fixture(params=DEVICE_COUNTS, ids=lambda count: f"{count}-devices")
+async def cloud(request, socket_enabled, aiohttp_server, monkeypatch):
+    devices = request.param
+    mock = MockDaisyCloud(
+        devices=devices,
+        installations=max(1, devices // DEVICES_PER_INSTALLATION),
+        rooms=5,
+        latency=LATENCY,
+    )
+    server = await aiohttp_server(mock.make_app())
+    monkeypatch.setattr(AsyncTelecoDaisy, "base_url", str(server.make_url("/")))
+    return mock
+
+
+async def _async_setup(hass, options: dict) -> tuple[MockConfigEntry, float]:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"username": "bench@example.com", "password": "secret"},
+        options=OPTIONS | options,
+    )
+    entry.add_to_hass(hass)
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    return entry, time.perf_counter() - start
+
+
+async def bench_setup_entry(hass, cloud, record):
+    devices = len(cloud.devices)
+    entry, elapsed = await _async_setup(hass, {})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    record("async_setup_entry (cold)", devices, elapsed)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    record("async_setup_entry (cached)", devices, time.perf_counter() - start)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    record("cached setup until first poll", devices, time.perf_counter() - start)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("bulk", [False, True], ids=["per-device", "room-list"])
+async def bench_poll_cycle(hass, cloud, record, bulk):
+    cloud.room_status = bulk
+    entry, _ = await _async_setup(hass, {"bulk_refresh": bulk})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinators = hass.data[DOMAIN][entry.entry_id].coordinators.values()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+    mode = "room-list" if bulk else "per-device"
+    record(
+        f"poll cycle ({mode})",
+        len(cloud.devices),
+        (time.perf_counter() - start) / ROUNDS,
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("optimistic", [False, True], ids=["read-back", "optimistic"])
+async def bench_command_round_trip(hass, cloud, record, optimistic):
+    entry, _ = await _async_setup(hass, {"optimistic": optimistic})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    cover = hass.states.async_entity_ids("cover")[0]
+
+    start = time.perf_counter()
+    for index in range(ROUNDS):
+        service = "open_cover" if index % 2 else "close_cover"
+        await hass.services.async_call(
+            "cover", service, {"entity_id": cover}, blocking=True
+        )
+    mode = "optimistic" if optimistic else "read-back"
+    record(
+        f"command round trip ({mode})",
+        len(cloud.devices),
+        (time.perf_counter() - start) / ROUNDS,
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
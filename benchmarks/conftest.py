@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+RESULTS: list[tuple[str, int, float]] = []
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+
+@pytest.fixture
+def record():
+    def _record(name: str, devices: int, seconds: float) -> None:
+        RESULTS.append((name, devices, seconds))
+
+    return _record
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not RESULTS:
+        return
+    terminalreporter.section("teleco_daisy benchmarks")
+    terminalreporter.write_line(f"{'measurement':<40}{'devices':>8}{'ms':>12}")
+    for name, devices, seconds in sorted(RESULTS):
+        terminalreporter.write_line(f"{name:<40}{devices:>8}{seconds * 1000:>12.1f}")
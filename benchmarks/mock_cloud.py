@@ -0,0 +1,243 @@
+"""Local stand-in for the Teleco Daisy cloud.
+
+Emulates the endpoints used by TelecoDaisy / AsyncTelecoDaisy (login,
+installation list, room list, device status and the tmate20 command/ack pair)
+for a generated account, with optional injected latency. Device state is kept
+in memory and updated by commands, so a command followed by a status read
+behaves like the real thing. With room_status the room list also carries the
+statusitemList of every device.
+
+Run standalone with ``python benchmarks/mock_cloud.py --devices 100``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from typing import Any
+
+from aiohttp import web
+
+# idDevicetype of DaisyWhiteLight, DaisyRGBLight, DaisyAwningsCover, DaisySlatsCover
+DEVICE_TYPES = (21, 23, 22, 24)
+LEVELS = {"LEV2": 33, "LEV3": 66, "LEV4": 100}
+
+
+class MockDaisyCloud:
+    def __init__(
+        self,
+        devices: int = 10,
+        installations: int = 1,
+        rooms: int = 1,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        ack_polls: int = 0,
+        room_status: bool = False,
+    ) -> None:
+        self.latency = latency
+        self.room_status = room_status
+        self.jitter = jitter
+        self.ack_polls = ack_polls
+        self.calls: Counter[str] = Counter()
+        self.sessions: set[str] = set()
+        self._acks: dict[str, int] = {}
+
+        self.installations = [
+            {
+                "activetimer": "N",
+                "firmwareVersion": "1.0",
+                "idInstallation": inst,
+                "idInstallationDevice": inst,
+                "instCode": f"INST{inst:04d}",
+                "instDescription": f"Installation {inst}",
+                "installationOrder": inst,
+                "latitude": None,
+                "longitude": None,
+                "weekend": None,
+                "workdays": None,
+            }
+            for inst in range(1, installations + 1)
+        ]
+        # devices are dealt round-robin over installations, then over rooms
+        self.devices: dict[int, dict[str, Any]] = {}
+        self.placement: dict[int, tuple[int, int]] = {}
+        self.state: dict[int, dict[str, str]] = {}
+        for index in range(devices):
+            id_device = 1000 + index
+            id_installation = index % installations + 1
+            id_room = (index // installations) % rooms + 1
+            device_type = DEVICE_TYPES[index % len(DEVICE_TYPES)]
+            self.devices[id_device] = {
+                "activetimer": "N",
+                "deviceCode": f"D{index}",
+                "deviceIndex": index,
+                "deviceOrder": index,
+                "favorite": "N",
+                "feedback": "Y",
+                "idDevicemodel": 1,
+                "idDevicetype": device_type,
+                "idInstallationDevice": id_device,
+                "label": f"Device {index}",
+                "remoteControlCode": "RC",
+            }
+            self.placement[id_device] = (id_installation, id_room)
+            if device_type in (21, 23):
+                self.state[id_device] = {"POWER": "OFF", "COLOR": "A100R255G255B255"}
+            else:
+                self.state[id_device] = {"OPEN_CLOSE": "CLOSE", "LEVEL": "0"}
+        self.rooms = rooms
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/teleco/services/account-login", self._login)
+        app.router.add_post(
+            "/teleco/services/account-installation-list", self._installations
+        )
+        app.router.add_post("/teleco/services/room-list", self._room_list)
+        app.router.add_post("/teleco/services/status-device-list", self._status)
+        app.router.add_post(
+            "/teleco/services/tmate20/feedthecommands/", self._feed_the_commands
+        )
+        app.router.add_post("/teleco/services/tmate20/getackcommand/", self._get_ack)
+        return app
+
+    async def _receive(self, request: web.Request) -> dict[str, Any]:
+        self.calls[request.path] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+        return await request.json()
+
+    def _authenticated(self, body: dict[str, Any]) -> bool:
+        return body.get("idSession") in self.sessions
+
+    @staticmethod
+    def _ok(result: Any) -> web.Response:
+        return web.json_response({"codEsito": "S", "valRisultato": result})
+
+    @staticmethod
+    def _rejected() -> web.Response:
+        return web.json_response(
+            {"codEsito": "E", "valRisultato": None, "msgEsito": "invalid session"}
+        )
+
+    async def _login(self, request: web.Request) -> web.Response:
+        await self._receive(request)
+        id_session = f"session-{len(self.sessions)}"
+        self.sessions.add(id_session)
+        return self._ok({"idAccount": 1, "idSession": id_session})
+
+    async def _installations(self, request: web.Request) -> web.Response:
+        if not self._authenticated(await self._receive(request)):
+            return self._rejected()
+        return self._ok({"installationList": self.installations})
+
+    async def _room_list(self, request: web.Request) -> web.Response:
+        body = await self._receive(request)
+        if not self._authenticated(body):
+            return self._rejected()
+        id_installation = body["idInstallation"]
+        room_list = []
+        for id_room in range(1, self.rooms + 1):
+            room_list.append(
+                {
+                    "idInstallationRoom": id_installation * 100 + id_room,
+                    "idRoomtype": 1,
+                    "roomDescription": f"Room {id_room}",
+                    "roomOrder": id_room,
+                    "deviceList": [
+                        device | self._room_status_of(id_device)
+                        for id_device, device in self.devices.items()
+                        if self.placement[id_device] == (id_installation, id_room)
+                    ],
+                }
+            )
+        return self._ok({"roomList": room_list})
+
+    async def _status(self, request: web.Request) -> web.Response:
+        body = await self._receive(request)
+        if not self._authenticated(body):
+            return self._rejected()
+        return self._ok(
+            {"statusitemList": self._status_items(body["idInstallationDevice"])}
+        )
+
+    def _room_status_of(self, id_device: int) -> dict[str, Any]:
+        if not self.room_status:
+            return {}
+        return {"statusitemList": self._status_items(id_device)}
+
+    def _status_items(self, id_device: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "idInstallationDeviceStatusitem": index,
+                "idDevicetypeStatusitemModel": index,
+                "statusitemCode": code,
+                "statusItem": code,
+                "statusValue": value,
+            }
+            for index, (code, value) in enumerate(self.state[id_device].items())
+        ]
+
+    async def _feed_the_commands(self, request: web.Request) -> web.Response:
+        body = await self._receive(request)
+        for command in body["commandsList"]:
+            self._apply(command)
+        reference = f"ACT{sum(self.calls.values())}"
+        self._acks[reference] = self.ack_polls
+        return web.json_response({"MessageID": "WS-000", "ActionReference": reference})
+
+    async def _get_ack(self, request: web.Request) -> web.Response:
+        body = await self._receive(request)
+        pending = self._acks.get(body["id"], 0)
+        if pending:
+            self._acks[body["id"]] = pending - 1
+            return web.json_response({"MessageID": "WS-300", "MessageText": "RCV"})
+        self._acks.pop(body["id"], None)
+        return web.json_response({"MessageID": "WS-300", "MessageText": "PROC"})
+
+    def _apply(self, command: dict[str, Any]) -> None:
+        state = self.state[command["idInstallationDevice"]]
+        param = command["commandParam"]
+        match command["commandAction"]:
+            case "POWER":
+                state["POWER"] = param
+            case "COLOR":
+                state["POWER"] = "ON"
+                state["COLOR"] = param
+            case "OPEN_STOP_CLOSE" if param != "STOP":
+                state["OPEN_CLOSE"] = param
+                state["LEVEL"] = "100" if param == "OPEN" else "0"
+            case "LEVEL":
+                state["OPEN_CLOSE"] = "OPEN"
+                state["LEVEL"] = str(LEVELS[param])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--installations", type=int, default=1)
+    parser.add_argument("--rooms", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--ack-polls", type=int, default=0)
+    parser.add_argument("--room-status", action="store_true")
+    args = parser.parse_args()
+
+    cloud = MockDaisyCloud(
+        devices=args.devices,
+        installations=args.installations,
+        rooms=args.rooms,
+        latency=args.latency,
+        jitter=args.jitter,
+        ack_polls=args.ack_polls,
+        room_status=args.room_status,
+    )
+    web.run_app(cloud.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,174 @@
+import asyncio
 import logging
+import time
+from datetime import datetime
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from .const import DOMAIN
-from .hub import DaisyHub
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
+from .api import DaisyApiError
+from .const import (
+    CONF_DEFER_STARTUP,
+    DEFAULT_DEFER_STARTUP,
+    DOMAIN,
+    INVENTORY_INTERVAL,
+)
+from .hub import DaisyHub, inventory_store, session_store
+from .metrics import DaisyMetricsView
+from .services import async_register_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["light", "cover"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    hass.http.register_view(DaisyMetricsView())
+    async_register_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    daisy_hub = DaisyHub(hass, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
-    await hass.async_add_executor_job(daisy_hub.login)
-    await hass.async_add_executor_job(daisy_hub.fetch_entities)
+    daisy_hub = DaisyHub(
+        hass,
+        entry.entry_id,
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        options=entry.options,
+    )
+    defer = entry.options.get(CONF_DEFER_STARTUP, DEFAULT_DEFER_STARTUP)
+    try:
+        with daisy_hub.startup_phase("load_cache"):
+            cached = await daisy_hub.async_load_cached_entities()
+        if cached or defer:
+            # entities come up from the cache (or are added once discovered);
+            # the cloud is contacted in the background
+            daisy_hub.create_coordinators()
+            daisy_hub.deferred = defer
+        else:
+            with daisy_hub.startup_phase("login"):
+                await daisy_hub.async_restore_session()
+            with daisy_hub.startup_phase("discovery"):
+                await daisy_hub.async_fetch_entities()
+            with daisy_hub.startup_phase("first_refresh"):
+                await daisy_hub.async_setup_coordinators()
+    except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+        await daisy_hub.async_close()
+        raise ConfigEntryNotReady(f"Unable to reach the Daisy cloud: {err}") from err
+    except BaseException:
+        await daisy_hub.async_close()
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = daisy_hub
 
+    async def _async_close_session(event: Event) -> None:
+        await daisy_hub.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
+    async def _async_inventory_interval(now: datetime) -> None:
+        await _async_update_inventory(daisy_hub)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_inventory_interval,
+            INVENTORY_INTERVAL,
+            name=f"{DOMAIN} inventory",
+            cancel_on_shutdown=True,
+        )
+    )
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    daisy_hub.startup_timings["setup_entry"] = round(
+        time.monotonic() - daisy_hub.setup_started, 3
+    )
+
+    if daisy_hub.deferred:
+
+        @callback
+        def _async_start_reconcile(hass: HomeAssistant) -> None:
+            daisy_hub.startup_timings["deferred"] = round(
+                time.monotonic() - daisy_hub.setup_started, 3
+            )
+            daisy_hub.deferred = False
+            entry.async_create_background_task(
+                hass,
+                _async_reconcile_inventory(daisy_hub),
+                f"{DOMAIN} inventory refresh",
+            )
+
+        entry.async_on_unload(async_at_started(hass, _async_start_reconcile))
+    elif cached:
+        entry.async_create_background_task(
+            hass,
+            _async_reconcile_inventory(daisy_hub),
+            f"{DOMAIN} inventory refresh",
+        )
+    else:
+        daisy_hub.log_startup_timings()
     return True
 
 
+async def _async_reconcile_inventory(daisy_hub: DaisyHub) -> None:
+    """Check the cached inventory against the cloud after a cached startup."""
+    with daisy_hub.startup_phase("login"):
+        try:
+            await daisy_hub.async_restore_session()
+        except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.warning("Unable to log in to the Daisy cloud: %s", err)
+    with daisy_hub.startup_phase("discovery"):
+        # every unseeded installation is refreshed below, new devices included
+        await _async_update_inventory(daisy_hub, refresh_added=False)
+
+    with daisy_hub.startup_phase("first_refresh"):
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh()
+                for id_installation, coordinator in daisy_hub.coordinators.items()
+                if id_installation not in daisy_hub.seeded
+            )
+        )
+    daisy_hub.log_startup_timings()
+
+
+async def _async_update_inventory(
+    daisy_hub: DaisyHub, refresh_added: bool = True
+) -> None:
+    try:
+        await daisy_hub.async_update_inventory(refresh_added)
+    except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.warning("Unable to refresh the Daisy device inventory: %s", err)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        daisy_hub = hass.data[DOMAIN].pop(entry.entry_id)
+        await daisy_hub.async_close()
 
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await session_store(hass, entry.entry_id).async_remove()
+    await inventory_store(hass, entry.entry_id).async_remove()
@@ -0,0 +1,827 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal, TypeVar
+
+import aiohttp
+
+from teleco_daisy import (
+    TelecoDaisy,
+    DaisyAwningsCover,
+    DaisyBaseDevice,
+    DaisyCover,
+    DaisyDevice,
+    DaisyInstallation,
+    DaisyLight,
+    DaisyRGBLight,
+    DaisyRoom,
+    DaisySlatsCover,
+    DaisyStatus,
+    DaisyWhiteLight,
+    base_url,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+ACK_POLL_DELAY = 0.5
+# give up on a command the cloud keeps reporting as received after ~15 s; the
+# wait holds the installation's scheduler slot
+ACK_MAX_POLLS = 30
+
+FAILURE_THRESHOLD = 5
+PROBE_INTERVAL = 60.0
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0)
+LATENCY_SAMPLES = 500
+
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+
+COVER_PERCENT_MAP = {
+    "33": ["LEV2", 97, "CH2"],
+    "66": ["LEV3", 98, "CH3"],
+    "100": ["LEV4", 99, "CH4"],
+}
+
+# commandId / lowlevelCommand per light type, as sent by the Daisy app
+RGB_LIGHT_PARAMS = {
+    "color": {"commandId": 137, "lowlevelCommand": None},
+    "on": {"commandId": 138, "lowlevelCommand": None},
+    "off": {"commandId": 138, "lowlevelCommand": None},
+}
+WHITE_LIGHT_PARAMS = {
+    "color": {"commandId": 146, "lowlevelCommand": "CH1"},
+    "on": {"commandId": 146, "lowlevelCommand": "CH1"},
+    "off": {"commandId": 147, "lowlevelCommand": "CH8"},
+}
+
+
+class DaisyApiError(Exception):
+    """The Daisy cloud answered with an error payload."""
+
+
+class DaisyUnavailableError(DaisyApiError):
+    """The circuit breaker is open; the request was not sent."""
+
+
+class DaisyConnectionStats:
+    """Counts new versus reused pooled connections of a client session."""
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "connections_created": self.created,
+            "connections_reused": self.reused,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+        }
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_create)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        return trace_config
+
+    async def _on_create(self, session, context, params) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, session, context, params) -> None:
+        self.reused += 1
+
+
+class DaisyEndpointLatency:
+    """Latency histogram and error count of a single endpoint.
+
+    Every HTTP attempt is observed on its own, retries included, so time
+    spent in the rate limiter or backing off never shows up here. Bucket
+    counts are cumulative over the lifetime of the client; the percentiles
+    are taken from the most recent LATENCY_SAMPLES attempts.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+        self._samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self._samples.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+
+    def percentile(self, percent: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def as_dict(self) -> dict[str, Any]:
+        def _round(value: float | None) -> float | None:
+            return None if value is None else round(value, 3)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean": _round(self.total / self.count if self.count else None),
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "p99": _round(self.percentile(99)),
+            "buckets": {
+                str(bound): count
+                for bound, count in zip(LATENCY_BUCKETS, self.buckets, strict=True)
+            },
+        }
+
+
+class DaisyLatencyStats:
+    """Per-endpoint request latencies of a client, keyed by the last URL segment."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, DaisyEndpointLatency] = {}
+
+    def endpoint(self, url: str) -> DaisyEndpointLatency:
+        name = url.rstrip("/").rsplit("/", 1)[-1]
+        if name not in self.endpoints:
+            self.endpoints[name] = DaisyEndpointLatency()
+        return self.endpoints[name]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            name: endpoint.as_dict()
+            for name, endpoint in sorted(self.endpoints.items())
+        }
+
+
+class DaisyRateLimiter:
+    """Token bucket shared by every request of a client.
+
+    Besides the steady rate/burst limit it can be paused as a whole, which is
+    how throttling and server errors back off all callers at once.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.requests = 0
+        self.delayed = 0
+        self.delay_total = 0.0
+        self.retries = 0
+
+    async def async_acquire(self) -> None:
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    wait = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                waited += wait
+        self.requests += 1
+        if waited:
+            self.delayed += 1
+            self.delay_total += waited
+
+    def pause(self, delay: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "delay_total": round(self.delay_total, 3),
+            "retries": self.retries,
+        }
+
+
+class DaisyCircuitBreaker:
+    """Stops sending requests after consecutive transport failures.
+
+    Once open, a single request is let through every probe_interval seconds;
+    the first one that succeeds closes the breaker again. on_change is called
+    with the new online state on every transition.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        probe_interval: float = PROBE_INTERVAL,
+        on_change: Callable[[bool], None] | None = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self._on_change = on_change
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: float | None = None
+        self._last_probe = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._last_probe >= self.probe_interval:
+            self._last_probe = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        if self._opened_at is not None:
+            self._opened_at = None
+            if self._on_change:
+                self._on_change(True)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._opened_at is None and self.failures >= self.failure_threshold:
+            self._opened_at = self._last_probe = time.monotonic()
+            self.trips += 1
+            if self._on_change:
+                self._on_change(False)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "open": self.is_open,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+        }
+
+
+class DaisyRequestScheduler:
+    """Runs the requests of one installation one at a time.
+
+    Waiting requests are dispatched by priority (commands before polls) and
+    then in arrival order, so a command waits for at most the request that is
+    already running.
+    """
+
+    COMMAND = 0
+    POLL = 1
+
+    def __init__(self) -> None:
+        self._waiting: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._busy = False
+        self.commands = 0
+        self.polls = 0
+
+    @property
+    def depth(self) -> int:
+        return sum(not future.done() for _, _, future in self._waiting)
+
+    async def async_run(self, priority: int, func: Callable[[], Awaitable[_T]]) -> _T:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was handed over just before the cancellation
+                self._release()
+            raise
+        if priority == self.COMMAND:
+            self.commands += 1
+        else:
+            self.polls += 1
+        try:
+            return await func()
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._busy = False
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while not self._busy and self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                self._busy = True
+                future.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"depth": self.depth, "commands": self.commands, "polls": self.polls}
+
+
+class DaisyInventory:
+    """The installations, rooms and supported devices of one account.
+
+    Devices are indexed by idInstallationDevice, idInstallation and
+    idInstallationRoom; the inventory is rebuilt, never mutated, when the
+    account is rediscovered.
+    """
+
+    def __init__(
+        self, inventory: list[tuple[DaisyInstallation, list[DaisyRoom]]] = ()
+    ) -> None:
+        self.installations: list[DaisyInstallation] = []
+        self.rooms: dict[int, list[DaisyRoom]] = {}
+        self.lights: list[DaisyLight] = []
+        self.covers: list[DaisyCover] = []
+        self.devices: dict[int, DaisyDevice] = {}
+        self.by_installation: dict[int, list[DaisyDevice]] = {}
+        self.by_room: dict[int, list[DaisyDevice]] = {}
+
+        for installation, rooms in inventory:
+            self.installations += [installation]
+            self.rooms[installation.idInstallation] = rooms
+            installation_devices = self.by_installation[
+                installation.idInstallation
+            ] = []
+            for room in rooms:
+                room_devices = self.by_room[room.idInstallationRoom] = []
+                for device in room.deviceList:
+                    if isinstance(device, DaisyWhiteLight | DaisyRGBLight):
+                        self.lights += [device]
+                    elif isinstance(device, DaisyAwningsCover | DaisySlatsCover):
+                        self.covers += [device]
+                    else:
+                        continue
+                    self.devices[device.idInstallationDevice] = device
+                    installation_devices += [device]
+                    room_devices += [device]
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_MAX)
+    delay = min(RETRY_BACKOFF_BASE * 2**attempt, RETRY_BACKOFF_MAX)
+    return random.uniform(delay / 2, delay)
+
+
+class AsyncTelecoDaisy(TelecoDaisy):
+    """Asyncio counterpart of TelecoDaisy.
+
+    Keeps the TelecoDaisy models (devices still reference this object as their
+    ``client``) but performs every request on an aiohttp session instead of the
+    blocking requests session.
+    """
+
+    base_url = base_url
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        email: str,
+        password: str,
+        rate_limiter: DaisyRateLimiter | None = None,
+        circuit_breaker: DaisyCircuitBreaker | None = None,
+    ):
+        # TelecoDaisy.__init__ only sets up a requests session we never use
+        self._session = session
+        self.rate_limiter = rate_limiter or DaisyRateLimiter(rate=10, burst=20)
+        self.circuit_breaker = circuit_breaker or DaisyCircuitBreaker()
+        self.latency = DaisyLatencyStats()
+        self.pending_requests = 0
+        self._state_reads: dict[int, asyncio.Task[list[DaisyStatus]]] = {}
+        self.schedulers: dict[int, DaisyRequestScheduler] = {}
+        self.state_reads_shared = 0
+        self._auth = aiohttp.BasicAuth("teleco", "tmate20")
+        self._login_lock = asyncio.Lock()
+        # requests that still failed after a re-login, by the session they
+        # failed on
+        self._rejected_requests: dict[tuple[str, str], str | None] = {}
+        self.email = email
+        self.password = password
+
+    async def _async_request(self, url: str, payload: dict | None) -> dict:
+        if not self.circuit_breaker.allow_request():
+            raise DaisyUnavailableError(f"Daisy cloud unavailable, not sending {url}")
+        self.pending_requests += 1
+        try:
+            result = await self._async_request_with_retry(url, payload)
+        except (aiohttp.ClientError, TimeoutError):
+            self.latency.endpoint(url).errors += 1
+            self.circuit_breaker.record_failure()
+            raise
+        finally:
+            self.pending_requests -= 1
+        self.circuit_breaker.record_success()
+        return result
+
+    async def _async_request_with_retry(self, url: str, payload: dict | None) -> dict:
+        latency = self.latency.endpoint(url)
+        attempt = 0
+        while True:
+            await self.rate_limiter.async_acquire()
+            # only the HTTP exchange is timed; limiter waits and backoff
+            # pauses are accounted for by the rate limiter
+            start = time.monotonic()
+            try:
+                async with self._session.post(
+                    self.base_url + url,
+                    json=payload,
+                    auth=self._auth,
+                    timeout=REQUEST_TIMEOUT,
+                ) as resp:
+                    if attempt >= MAX_RETRIES or (
+                        resp.status != 429 and resp.status < 500
+                    ):
+                        resp.raise_for_status()
+                        return await resp.json(content_type=None)
+                    delay = _retry_delay(attempt, resp.headers.get("Retry-After"))
+            finally:
+                latency.observe(time.monotonic() - start)
+            _LOGGER.debug(
+                "%s answered %s, backing off for %.1fs", url, resp.status, delay
+            )
+            self.rate_limiter.retries += 1
+            self.rate_limiter.pause(delay)
+            attempt += 1
+
+    async def _async_tmate20_post(self, url: str, json: dict | None = None) -> dict:
+        payload = {"idSession": self.idSession}
+        if json:
+            payload |= json
+        return await self._async_request(url, payload)
+
+    async def _async_post(
+        self, url: str, json: dict | None = None, unauth: bool = False
+    ) -> dict:
+        if unauth:
+            return await self._async_post_once(url, json)
+
+        id_session = self.idSession
+        request = (url, repr(json))
+        try:
+            return await self._async_post_once(url, json, authenticated=True)
+        except DaisyUnavailableError:
+            raise
+        except DaisyApiError as err:
+            if self._rejected_requests.get(request) == id_session:
+                # already failed on this very session right after a login, so
+                # the error is not about the session; don't log in again
+                raise
+            # most likely an expired or restored session token; log in once
+            # (shared by all concurrent callers) and retry
+            _LOGGER.debug("Request to %s rejected (%s), logging in again", url, err)
+            await self._async_relogin(id_session)
+            try:
+                return await self._async_post_once(url, json, authenticated=True)
+            except DaisyUnavailableError:
+                raise
+            except DaisyApiError:
+                self._rejected_requests[request] = self.idSession
+                raise
+
+    async def _async_post_once(
+        self, url: str, json: dict | None = None, authenticated: bool = False
+    ) -> dict:
+        if authenticated:
+            _json = {"idSession": self.idSession, "idAccount": self.idAccount}
+            if json:
+                _json |= json
+        else:
+            _json = json
+        req_json = await self._async_request(url, _json)
+        if req_json["codEsito"] != "S":
+            self.latency.endpoint(url).errors += 1
+            raise DaisyApiError(req_json)
+        return req_json["valRisultato"]
+
+    async def _async_relogin(self, stale_session: str | None) -> None:
+        async with self._login_lock:
+            if self.idSession == stale_session:
+                await self.async_login()
+
+    async def async_login(self) -> None:
+        login = await self._async_post(
+            "teleco/services/account-login",
+            {"email": self.email, "pwd": self.password},
+            unauth=True,
+        )
+        self.idAccount = login["idAccount"]
+        self.idSession = login["idSession"]
+        self._rejected_requests.clear()
+
+    async def async_get_account_installation_list(self) -> list[DaisyInstallation]:
+        req = await self._async_post("teleco/services/account-installation-list")
+
+        return [DaisyInstallation(**inst) for inst in req["installationList"]]
+
+    async def async_get_room_list(
+        self, installation: DaisyInstallation
+    ) -> list[DaisyRoom]:
+        rooms, _ = await self.async_get_room_list_with_status(installation)
+        return rooms
+
+    async def async_get_room_list_with_status(
+        self, installation: DaisyInstallation
+    ) -> tuple[list[DaisyRoom], dict[int, list[DaisyStatus]]]:
+        """Rooms of an installation plus the device states the payload carries."""
+        room_list = await self._async_post(
+            "teleco/services/room-list",
+            {"idInstallation": installation.idInstallation},
+        )
+
+        return (
+            self.build_rooms(installation, room_list["roomList"]),
+            room_status(room_list["roomList"]),
+        )
+
+    async def async_room_status(
+        self, installation: DaisyInstallation
+    ) -> dict[int, list[DaisyStatus]]:
+        """Device states from the room list, without building the room models."""
+        room_list = await self._async_post(
+            "teleco/services/room-list",
+            {"idInstallation": installation.idInstallation},
+        )
+        return room_status(room_list["roomList"])
+
+    def build_rooms(
+        self, installation: DaisyInstallation, room_list: list[dict]
+    ) -> list[DaisyRoom]:
+        """Turn raw room-list entries into DaisyRoom models bound to this client."""
+        return [
+            DaisyRoom(
+                **room
+                | {
+                    "deviceList": [
+                        dv | {"installation": installation, "client": self}
+                        for dv in room["deviceList"]
+                    ]
+                }
+            )
+            for room in room_list
+        ]
+
+    async def async_status_device_list(
+        self, installation: DaisyInstallation, device: DaisyDevice
+    ) -> list[DaisyStatus]:
+        status_device_list = await self._async_post(
+            "teleco/services/status-device-list",
+            {
+                "idInstallation": installation.idInstallation,
+                "idInstallationDevice": device.idInstallationDevice,
+            },
+        )
+
+        return [DaisyStatus(**x) for x in status_device_list["statusitemList"]]
+
+    async def async_feed_the_commands(
+        self,
+        installation: DaisyInstallation,
+        commandsList: list[dict],
+        ignore_ack: bool = False,
+    ) -> dict:
+        res = await self._async_tmate20_post(
+            "teleco/services/tmate20/feedthecommands/",
+            json={
+                "commandsList": commandsList,
+                "idInstallation": installation.instCode,
+                "idScenario": 0,
+                "isScenario": False,
+            },
+        )
+        if res["MessageID"] != "WS-000":
+            self.latency.endpoint("feedthecommands").errors += 1
+            raise DaisyApiError(res)
+
+        if ignore_ack:
+            return {"success": None}
+
+        return await self._async_get_ack(installation, res["ActionReference"])
+
+    async def _async_get_ack(
+        self, installation: DaisyInstallation, action_reference: str
+    ) -> dict:
+        for _ in range(ACK_MAX_POLLS):
+            res = await self._async_tmate20_post(
+                "teleco/services/tmate20/getackcommand/",
+                json={
+                    "id": action_reference,
+                    "idInstallation": installation.instCode,
+                    "idSession": self.idSession,
+                },
+            )
+            if res["MessageID"] != "WS-300":
+                self.latency.endpoint("getackcommand").errors += 1
+                raise DaisyApiError(res)
+            if res["MessageText"] != "RCV":
+                return {"success": res["MessageText"] == "PROC"}
+            await asyncio.sleep(ACK_POLL_DELAY)
+        self.latency.endpoint("getackcommand").errors += 1
+        raise DaisyApiError(
+            f"No acknowledgement for {action_reference} after {ACK_MAX_POLLS} polls"
+        )
+
+    async def async_update_state(self, device: DaisyDevice) -> list[DaisyStatus]:
+        """Read and apply the state of a device.
+
+        Concurrent calls for the same device share a single request; a caller
+        being cancelled does not cancel the read for the others.
+        """
+        key = device.idInstallationDevice
+        if (task := self._state_reads.get(key)) is None:
+            task = asyncio.ensure_future(self._async_read_state(device))
+            self._state_reads[key] = task
+            task.add_done_callback(lambda done: self._state_read_done(key, done))
+        else:
+            self.state_reads_shared += 1
+        return await asyncio.shield(task)
+
+    def _state_read_done(self, key: int, task: asyncio.Task[list[DaisyStatus]]) -> None:
+        if self._state_reads.get(key) is task:
+            del self._state_reads[key]
+        # every caller may have been cancelled; retrieve the exception so it
+        # is not reported as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    def cancel_state_reads(self) -> None:
+        """Cancel the shared state reads still in flight, e.g. before closing."""
+        for task in self._state_reads.values():
+            task.cancel()
+
+    async def _async_read_state(self, device: DaisyDevice) -> list[DaisyStatus]:
+        stati = await self.scheduler(device.installation).async_run(
+            DaisyRequestScheduler.POLL,
+            lambda: self.async_status_device_list(device.installation, device),
+        )
+        apply_status(device, stati)
+        return stati
+
+    def scheduler(self, installation: DaisyInstallation) -> DaisyRequestScheduler:
+        if installation.idInstallation not in self.schedulers:
+            self.schedulers[installation.idInstallation] = DaisyRequestScheduler()
+        return self.schedulers[installation.idInstallation]
+
+    async def _async_device_command(
+        self, device: DaisyDevice, params: dict[str, Any]
+    ) -> dict:
+        return await self.scheduler(device.installation).async_run(
+            DaisyRequestScheduler.COMMAND,
+            lambda: self.async_feed_the_commands(
+                installation=device.installation,
+                commandsList=[
+                    {
+                        "deviceCode": str(device.deviceIndex),
+                        "idInstallationDevice": device.idInstallationDevice,
+                    }
+                    | params
+                ],
+            ),
+        )
+
+    async def async_open_cover(
+        self, cover: DaisyCover, percent: Literal["33", "66", "100"] | None = None
+    ) -> dict:
+        if percent is None or percent == "100":
+            return await self._async_open_stop_close(cover, "open")
+        c_param, c_id, c_ll = COVER_PERCENT_MAP[percent]
+        return await self._async_device_command(
+            cover,
+            {
+                "commandAction": "LEVEL",
+                "commandId": c_id,
+                "commandParam": c_param,
+                "lowlevelCommand": c_ll,
+            },
+        )
+
+    async def async_stop_cover(self, cover: DaisyCover) -> dict:
+        return await self._async_open_stop_close(cover, "stop")
+
+    async def async_close_cover(self, cover: DaisyCover) -> dict:
+        return await self._async_open_stop_close(cover, "close")
+
+    async def _async_open_stop_close(
+        self, cover: DaisyCover, open_stop_close: Literal["open", "stop", "close"]
+    ) -> dict:
+        return await self._async_device_command(
+            cover,
+            {"commandAction": "OPEN_STOP_CLOSE"} | cover.osc_map[open_stop_close],
+        )
+
+    async def async_set_rgb_and_brightness(
+        self,
+        light: DaisyLight,
+        rgb: tuple[int, int, int] | None = None,
+        brightness: int | None = None,
+    ) -> dict:
+        if brightness is None:
+            brightness = light.brightness or 0
+        if 0 > brightness or brightness > 100:
+            raise ValueError("Brightness must be between 0 and 100")
+        if rgb is None:
+            rgb = light.rgb or (255, 255, 255)
+        if any((c < 0 or c > 255) for c in rgb):
+            raise ValueError("Color must be between 0 and 255")
+
+        v = f"A{brightness:03d}R{rgb[0]:03d}G{rgb[1]:03d}B{rgb[2]:03d}"
+        return await self._async_device_command(
+            light,
+            {"commandAction": "COLOR", "commandParam": v}
+            | _light_params(light)["color"],
+        )
+
+    async def async_turn_on(self, light: DaisyLight) -> dict:
+        return await self._async_device_command(
+            light,
+            {"commandAction": "POWER", "commandParam": "ON"}
+            | _light_params(light)["on"],
+        )
+
+    async def async_turn_off(self, light: DaisyLight) -> dict:
+        return await self._async_device_command(
+            light,
+            {"commandAction": "POWER", "commandParam": "OFF"}
+            | _light_params(light)["off"],
+        )
+
+
+def _light_params(light: DaisyLight) -> dict[str, dict[str, Any]]:
+    if isinstance(light, DaisyRGBLight):
+        return RGB_LIGHT_PARAMS
+    return WHITE_LIGHT_PARAMS
+
+
+def apply_status(device: DaisyDevice, stati: list[DaisyStatus]) -> None:
+    """Mirror of the update_state parsing in the TelecoDaisy device models."""
+    for status in stati:
+        if isinstance(device, DaisyCover):
+            if status.statusitemCode == "OPEN_CLOSE":
+                match status.statusValue:
+                    case "CLOSE":
+                        device.is_closed = True
+                    case "OPEN":
+                        device.is_closed = False
+                    case _:
+                        device.is_closed = None
+            if status.statusitemCode == "LEVEL":
+                device.position = int(status.statusValue)
+        elif isinstance(device, DaisyLight):
+            if status.statusitemCode == "POWER":
+                device.is_on = status.statusValue == "ON"
+            if status.statusitemCode == "COLOR":
+                val = status.statusValue
+                device.brightness = int(val[1:4])
+                device.rgb = (int(val[5:8]), int(val[9:12]), int(val[13:16]))
+
+
+def room_status(room_list: list[dict]) -> dict[int, list[DaisyStatus]]:
+    """Device states carried by a room-list payload, by idInstallationDevice.
+
+    Devices the payload has no statusitemList for are left out.
+    """
+    return {
+        device["idInstallationDevice"]: [
+            DaisyStatus(**x) for x in device["statusitemList"]
+        ]
+        for room in room_list
+        for device in room["deviceList"]
+        if device.get("statusitemList")
+    }
+
+
+def dump_room(room: DaisyRoom) -> dict[str, Any]:
+    """Inverse of build_rooms, keeping only the discovery fields."""
+    return room.model_dump(exclude={"deviceList"}) | {
+        "deviceList": [
+            device.model_dump(include=set(DaisyBaseDevice.model_fields))
+            for device in room.deviceList
+        ]
+    }
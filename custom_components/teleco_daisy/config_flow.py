@@ -3,10 +3,35 @@ from typing import Any, Dict, Optional
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
+from homeassistant.core import callback
 
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CONF_AWNING_TRAVEL_TIME,
+    CONF_BULK_REFRESH,
+    CONF_COMMAND_DEBOUNCE,
+    CONF_DEFER_STARTUP,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_POOL_SIZE,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_SLATS_TRAVEL_TIME,
+    DEFAULT_AWNING_TRAVEL_TIME,
+    DEFAULT_BULK_REFRESH,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_DEFER_STARTUP,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_SLATS_TRAVEL_TIME,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,3 +55,84 @@ class TelecoDaisyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=AUTH_SCHEMA, errors=errors
         )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        return TelecoDaisyOptionsFlow()
+
+
+class TelecoDaisyOptionsFlow(config_entries.OptionsFlow):
+    async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None):
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors[CONF_MAX_SCAN_INTERVAL] = "max_below_min"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_POOL_SIZE,
+                        default=options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                    vol.Optional(
+                        CONF_RATE_LIMIT,
+                        default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+                    vol.Optional(
+                        CONF_RATE_BURST,
+                        default=options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONF_COMMAND_DEBOUNCE,
+                        default=options.get(
+                            CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_OPTIMISTIC,
+                        default=options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=86400)),
+                    vol.Optional(
+                        CONF_AWNING_TRAVEL_TIME,
+                        default=options.get(
+                            CONF_AWNING_TRAVEL_TIME, DEFAULT_AWNING_TRAVEL_TIME
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                    vol.Optional(
+                        CONF_SLATS_TRAVEL_TIME,
+                        default=options.get(
+                            CONF_SLATS_TRAVEL_TIME, DEFAULT_SLATS_TRAVEL_TIME
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                    vol.Optional(
+                        CONF_BULK_REFRESH,
+                        default=options.get(CONF_BULK_REFRESH, DEFAULT_BULK_REFRESH),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEFER_STARTUP,
+                        default=options.get(CONF_DEFER_STARTUP, DEFAULT_DEFER_STARTUP),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
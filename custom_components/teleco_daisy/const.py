@@ -1 +1,53 @@
+from datetime import timedelta
+
 DOMAIN = "teleco_daisy"
+
+INVENTORY_INTERVAL = timedelta(hours=1)
+
+CONF_POOL_SIZE = "pool_size"
+DEFAULT_POOL_SIZE = 4
+KEEPALIVE_TIMEOUT = 60
+
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_RATE_BURST = 20
+
+CONF_COMMAND_DEBOUNCE = "command_debounce"
+DEFAULT_COMMAND_DEBOUNCE = 0.5
+
+CONF_OPTIMISTIC = "optimistic"
+DEFAULT_OPTIMISTIC = True
+CONFIRM_DELAY = 5
+
+DISCOVERY_CONCURRENCY = 4
+
+# refresh installations from one room-list request where it carries the state
+CONF_BULK_REFRESH = "bulk_refresh"
+DEFAULT_BULK_REFRESH = True
+
+# postpone login and discovery until Home Assistant has started
+CONF_DEFER_STARTUP = "defer_startup"
+DEFAULT_DEFER_STARTUP = False
+
+# time a cover takes from fully closed to fully open, per cover type; positions
+# in between are interpolated while it moves
+CONF_AWNING_TRAVEL_TIME = "awning_travel_time"
+CONF_SLATS_TRAVEL_TIME = "slats_travel_time"
+DEFAULT_AWNING_TRAVEL_TIME = 30
+DEFAULT_SLATS_TRAVEL_TIME = 15
+TRAVEL_UPDATE_INTERVAL = timedelta(seconds=1)
+
+# polling speeds up to the minimum interval for ACTIVITY_WINDOW after a command
+# or observed change, then doubles every cycle up to the maximum interval
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 300
+ACTIVITY_WINDOW = timedelta(minutes=2)
+
+SERVICE_SET_COVERS = "set_covers"
+# commands the set_covers service has in flight at once
+SET_COVERS_CONCURRENCY = 4
+
+STORAGE_VERSION = 1
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from teleco_daisy import DaisyCover, DaisyDevice, DaisyInstallation, DaisyLight
+
+from .api import DaisyApiError
+from .const import ACTIVITY_WINDOW, DOMAIN
+
+if TYPE_CHECKING:
+    from .hub import DaisyHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DaisyInstallationCoordinator(DataUpdateCoordinator[None]):
+    """Refreshes every device of one installation in a single cycle."""
+
+    def __init__(
+        self, hass: HomeAssistant, hub: DaisyHub, installation: DaisyInstallation
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {installation.instDescription}",
+            update_interval=hub.min_scan_interval,
+        )
+        self.hub = hub
+        self.installation = installation
+        self._active_until = time.monotonic() + ACTIVITY_WINDOW.total_seconds()
+        self.polls = 0
+        self.poll_duration_total = 0.0
+        self.last_poll_duration: float | None = None
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll at the minimum interval for a while, starting now."""
+        self._active_until = time.monotonic() + ACTIVITY_WINDOW.total_seconds()
+        if self.update_interval != self.hub.min_scan_interval:
+            self.update_interval = self.hub.min_scan_interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    def _async_adapt_interval(self, changed: bool) -> None:
+        if changed:
+            self._active_until = time.monotonic() + ACTIVITY_WINDOW.total_seconds()
+        if time.monotonic() < self._active_until:
+            self.update_interval = self.hub.min_scan_interval
+        else:
+            self.update_interval = min(
+                self.update_interval * 2, self.hub.max_scan_interval
+            )
+
+    async def _async_update_data(self) -> None:
+        if self.hub.deferred:
+            # Home Assistant is still starting; keep the cached placeholders
+            return
+        if not self.hub.online and not await self.hub.async_probe():
+            raise UpdateFailed("Daisy cloud is unavailable")
+
+        devices = self.hub.devices_for_installation(self.installation)
+        before = [device_snapshot(device) for device in devices]
+        start = time.monotonic()
+        try:
+            results = await self.hub.async_refresh_installation(self.installation)
+        except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+            raise UpdateFailed(
+                f"Error updating {self.installation.instDescription}: {err}"
+            ) from err
+        finally:
+            self.last_poll_duration = time.monotonic() - start
+            self.poll_duration_total += self.last_poll_duration
+            self.polls += 1
+        for result in results:
+            if isinstance(result, DaisyApiError | aiohttp.ClientError | TimeoutError):
+                raise UpdateFailed(
+                    f"Error updating {self.installation.instDescription}: {result}"
+                ) from result
+            if isinstance(result, BaseException):
+                raise result
+        self._async_adapt_interval(
+            before != [device_snapshot(device) for device in devices]
+        )
+
+
+def device_snapshot(device: DaisyDevice) -> tuple:
+    """Compact, comparable view of the state attributes of a device."""
+    if isinstance(device, DaisyLight):
+        return (device.is_on, device.brightness, device.rgb)
+    if isinstance(device, DaisyCover):
+        return (device.is_closed, device.position)
+    return ()
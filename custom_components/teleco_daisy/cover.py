@@ -1,22 +1,40 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Awaitable
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.cover import (
     CoverEntity,
     CoverDeviceClass,
+    ATTR_CURRENT_POSITION,
+    ATTR_CURRENT_TILT_POSITION,
     ATTR_POSITION,
     ATTR_TILT_POSITION,
     CoverEntityFeature,
+    CoverState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
-from teleco_daisy import DaisyAwningsCover, DaisySlatsCover
+from .const import (
+    CONF_AWNING_TRAVEL_TIME,
+    CONF_SLATS_TRAVEL_TIME,
+    CONFIRM_DELAY,
+    DEFAULT_AWNING_TRAVEL_TIME,
+    DEFAULT_SLATS_TRAVEL_TIME,
+    DOMAIN,
+    TRAVEL_UPDATE_INTERVAL,
+)
+from .coordinator import DaisyInstallationCoordinator
+from .entity import TelecoDaisyEntity
+from teleco_daisy import DaisyAwningsCover, DaisyDevice, DaisySlatsCover
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,15 +45,48 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     hub = hass.data[DOMAIN][config_entry.entry_id]
-    async_add_entities([TelecoDaisyCover(cover) for cover in hub.covers])
+    awning_travel_time = config_entry.options.get(
+        CONF_AWNING_TRAVEL_TIME, DEFAULT_AWNING_TRAVEL_TIME
+    )
+    slats_travel_time = config_entry.options.get(
+        CONF_SLATS_TRAVEL_TIME, DEFAULT_SLATS_TRAVEL_TIME
+    )
 
+    @callback
+    def _async_add_covers(devices: list[DaisyDevice]) -> None:
+        async_add_entities(
+            [
+                TelecoDaisyCover(
+                    hub.coordinator_for(cover),
+                    cover,
+                    awning_travel_time
+                    if isinstance(cover, DaisyAwningsCover)
+                    else slats_travel_time,
+                )
+                for cover in devices
+                if isinstance(cover, DaisyAwningsCover | DaisySlatsCover)
+            ]
+        )
 
-class TelecoDaisyCover(CoverEntity):
-    def __init__(self, cover: DaisyAwningsCover | DaisySlatsCover) -> None:
-        self._cover = cover
+    _async_add_covers(hub.covers)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, hub.signal_devices_added, _async_add_covers)
+    )
 
-        self._attr_unique_id = str(cover.idInstallationDevice)
-        self._attr_name = cover.label
+
+class TelecoDaisyCover(TelecoDaisyEntity, CoverEntity):
+    def __init__(
+        self,
+        coordinator: DaisyInstallationCoordinator,
+        cover: DaisyAwningsCover | DaisySlatsCover,
+        travel_time: float,
+    ) -> None:
+        super().__init__(coordinator, cover)
+        self._cover = cover
+        self._travel_time = travel_time
+        # (started, from position, to position) while the cover is moving
+        self._travel: tuple[float, int, int] | None = None
+        self._cancel_travel_update: CALLBACK_TYPE | None = None
 
         if isinstance(cover, DaisyAwningsCover):
             self._attr_device_class = CoverDeviceClass.AWNING
@@ -54,82 +105,169 @@ class TelecoDaisyCover(CoverEntity):
                 | CoverEntityFeature.STOP_TILT
             )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._attr_unique_id)},
-            name=self._attr_name,
-            manufacturer="Teleco Automation",
-        )
-
     @property
     def is_closed(self) -> bool | None:
         return self._cover.is_closed
 
     @property
     def current_cover_position(self) -> int | None:
+        if self._travel is not None:
+            return self._travel_position()
         return self._cover.position
 
     @property
     def current_cover_tilt_position(self) -> int | None:
-        return self._cover.position
+        return self.current_cover_position
 
-    # @property
-    # def is_closing(self) -> bool:
-    #     """Return if the cover is closing or not."""
-    #     return self._roller.moving < 0
-    #
-    # @property
-    # def is_opening(self) -> bool:
-    #     """Return if the cover is opening or not."""
-    #     return self._roller.moving > 0
-    #
-    def open_cover(self, **kwargs: Any) -> None:
-        self._cover.open_cover()
-        self.update()
-
-    def close_cover(self, **kwargs: Any) -> None:
-        self._cover.close_cover()
-        self.update()
-
-    def set_cover_position(self, **kwargs: Any) -> None:
-        position = kwargs[ATTR_POSITION]
-        if position <= 15:
-            self._cover.close_cover()
-        elif 15 < position <= 48:
-            self._cover.open_cover("33")
-        elif 48 < position <= 81:
-            self._cover.open_cover("66")
+    @property
+    def is_closing(self) -> bool:
+        return self._travel is not None and self._travel[2] < self._travel[1]
+
+    @property
+    def is_opening(self) -> bool:
+        return self._travel is not None and self._travel[2] > self._travel[1]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_end_travel)
+
+    def _restore_state(self, state: State) -> None:
+        position = state.attributes.get(
+            ATTR_CURRENT_POSITION, state.attributes.get(ATTR_CURRENT_TILT_POSITION)
+        )
+        if position is not None:
+            self._cover.position = position
+            self._cover.is_closed = position == 0
         else:
-            self._cover.open_cover("100")
-        self.update()
+            self._cover.is_closed = state.state == CoverState.CLOSED
 
-    def stop_cover(self, **kwargs: Any) -> None:
-        self._cover.stop_cover()
-        self.update()
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        await self._async_travel(self._hub.async_open_cover(self._cover), 100)
 
-    def open_cover_tilt(self, **kwargs: Any) -> None:
-        self.open_cover(**kwargs)
+    async def async_close_cover(self, **kwargs: Any) -> None:
+        await self._async_travel(self._hub.async_close_cover(self._cover), 0)
 
-    def close_cover_tilt(self, **kwargs: Any) -> None:
-        self.close_cover(**kwargs)
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
+        await self.async_move_to(kwargs[ATTR_POSITION])
 
-    def set_cover_tilt_position(self, **kwargs: Any) -> None:
-        position = kwargs[ATTR_TILT_POSITION]
+    async def async_stop_cover(self, **kwargs: Any) -> None:
+        if self._travel is None:
+            await self._async_send(self._hub.async_stop_cover(self._cover))
+            return
+        position = self._travel_position()
+        self._async_end_travel()
+        await self._async_send(
+            self._hub.async_stop_cover(self._cover),
+            is_closed=position == 0,
+            position=position,
+        )
+
+    async def async_open_cover_tilt(self, **kwargs: Any) -> None:
+        await self.async_open_cover(**kwargs)
+
+    async def async_close_cover_tilt(self, **kwargs: Any) -> None:
+        await self.async_close_cover(**kwargs)
+
+    async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
+        await self.async_move_to(kwargs[ATTR_TILT_POSITION])
+
+    async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
+        await self.async_stop_cover(**kwargs)
+
+    async def async_move_to(self, position: int, refresh: bool = True) -> None:
+        """Move to the nearest level the Daisy supports.
+
+        The set_covers service passes refresh=False and refreshes all moved
+        covers at once afterwards.
+        """
         if position <= 15:
-            self._cover.close_cover()
-        elif 15 < position <= 48:
-            self._cover.open_cover("33")
-        elif 48 < position <= 81:
-            self._cover.open_cover("66")
+            command, target = self._hub.async_close_cover(self._cover), 0
+        elif position <= 48:
+            command, target = self._hub.async_open_cover(self._cover, "33"), 33
+        elif position <= 81:
+            command, target = self._hub.async_open_cover(self._cover, "66"), 66
         else:
-            self._cover.open_cover("100")
-        self.update()
+            command, target = self._hub.async_open_cover(self._cover), 100
+        await self._async_travel(command, target, refresh)
+
+    async def _async_travel(
+        self, command: Awaitable[Any], target: int, refresh: bool = True
+    ) -> None:
+        """Send a movement command and follow the cover until it should arrive.
+
+        The position is interpolated locally while moving; the state is only
+        read from the cloud once, at the predicted completion, instead of
+        right after the command while the cover is still on its way.
+        """
+        self._async_start_travel(target)
+        travelling = self._travel is not None
+        try:
+            await self._async_send(
+                command,
+                refresh and not travelling,
+                is_closed=target == 0,
+                position=target,
+            )
+        except HomeAssistantError:
+            self._async_end_travel()
+            if refresh and travelling and self._hub.optimistic:
+                self._async_schedule_confirm()
+            raise
+        if refresh and travelling:
+            self._async_schedule_confirm()
+
+    @callback
+    def _async_start_travel(self, target: int) -> None:
+        start = self.current_cover_position
+        if start is None:
+            # unknown position, assume a full run
+            start = 100 - target if target in (0, 100) else 0
+        self._async_end_travel()
+        if start == target:
+            return
+        self._travel = (time.monotonic(), start, target)
+        self._cancel_travel_update = async_track_time_interval(
+            self.hass, self._async_travel_update, TRAVEL_UPDATE_INTERVAL
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_end_travel(self) -> None:
+        self._travel = None
+        if self._cancel_travel_update is not None:
+            self._cancel_travel_update()
+            self._cancel_travel_update = None
+
+    @callback
+    def _async_travel_update(self, _now: datetime) -> None:
+        if self._travel_remaining() <= 0:
+            # report the target until the confirmation poll replaces it
+            target = self._travel[2]
+            self._cover.position = target
+            self._cover.is_closed = target == 0
+            self._async_end_travel()
+        self.async_write_ha_state()
+
+    def _travel_position(self) -> int:
+        started, start, target = self._travel
+        moved = (time.monotonic() - started) / self._travel_time * 100
+        if target > start:
+            return min(target, round(start + moved))
+        return max(target, round(start - moved))
+
+    def _travel_remaining(self) -> float:
+        started, start, target = self._travel
+        duration = abs(target - start) / 100 * self._travel_time
+        return max(0.0, duration - (time.monotonic() - started))
+
+    def _state_snapshot(self) -> tuple:
+        return (*super()._state_snapshot(), self._travel)
 
-    def stop_cover_tilt(self, **kwargs: Any) -> None:
-        self.stop_cover(**kwargs)
+    def _confirm_delay(self) -> float:
+        if self._travel is None:
+            return CONFIRM_DELAY
+        return max(self._travel_remaining(), CONFIRM_DELAY)
 
-    def update(self) -> None:
-        self._cover.update_state()
-        self._attr_is_closed = self._cover.is_closed
-        self._attr_current_cover_position = self._cover.position
+    async def _async_confirm_state(self, _now: datetime) -> None:
+        self._async_end_travel()
+        await super()._async_confirm_state(_now)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .hub import DaisyHub
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    daisy_hub: DaisyHub = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "hub": {
+            "online": daisy_hub.online,
+            "installations": len(daisy_hub.installations),
+            "lights": len(daisy_hub.lights),
+            "covers": len(daisy_hub.covers),
+        },
+        "latency": daisy_hub.latency.as_dict(),
+        "connections": daisy_hub.connection_stats.as_dict(),
+        "rate_limiter": daisy_hub.rate_limiter.as_dict(),
+        "state_reads_shared": daisy_hub.state_reads_shared,
+        "suppressed_writes": daisy_hub.suppressed_writes,
+        "circuit_breaker": daisy_hub.circuit_breaker.as_dict(),
+        "startup_timings": daisy_hub.startup_timings,
+        "discovery_timings": {
+            str(id_installation): round(elapsed, 3)
+            for id_installation, elapsed in daisy_hub.discovery_timings.items()
+        },
+        "coordinators": {
+            str(id_installation): {
+                "last_update_success": coordinator.last_update_success,
+                "queue": daisy_hub.scheduler(coordinator.installation).as_dict(),
+                "update_interval": coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None,
+            }
+            for id_installation, coordinator in daisy_hub.coordinators.items()
+        },
+    }
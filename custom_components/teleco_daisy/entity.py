@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable
+from datetime import datetime
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from teleco_daisy import DaisyDevice
+
+from .api import DaisyApiError
+from .const import CONFIRM_DELAY, DOMAIN
+from .coordinator import DaisyInstallationCoordinator, device_snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TelecoDaisyEntity(CoordinatorEntity[DaisyInstallationCoordinator], RestoreEntity):
+    def __init__(
+        self, coordinator: DaisyInstallationCoordinator, device: DaisyDevice
+    ) -> None:
+        super().__init__(coordinator)
+        self._hub = coordinator.hub
+        self._device = device
+        self._cancel_confirm: CALLBACK_TYPE | None = None
+        self._written_snapshot: tuple | None = None
+
+        self._attr_unique_id = str(device.idInstallationDevice)
+        self._attr_name = device.label
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
+            name=self._attr_name,
+            manufacturer="Teleco Automation",
+        )
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._hub.online
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_confirm)
+        if (
+            all(value is None for value in device_snapshot(self._device))
+            and (last_state := await self.async_get_last_state())
+            and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        ):
+            self._restore_state(last_state)
+            # marked as assumed until the first refresh replaces it
+            self._attr_assumed_state = True
+
+    def _restore_state(self, state: State) -> None:
+        """Put the last known state back on the device model.
+
+        Does nothing by default; platforms override it for their attributes.
+        """
+
+    def _state_snapshot(self) -> tuple:
+        """Everything the written state depends on, for change detection."""
+        return (self.available, self.assumed_state, device_snapshot(self._device))
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._written_snapshot = self._state_snapshot()
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.last_update_success and not self._hub.deferred:
+            self._attr_assumed_state = False
+        if self._state_snapshot() == self._written_snapshot:
+            self._hub.suppressed_writes += 1
+            return
+        self.async_write_ha_state()
+
+    async def _async_refresh_device(self) -> None:
+        await self._hub.async_update_state(self._device)
+        self._attr_assumed_state = False
+        self.async_write_ha_state()
+
+    async def _async_send(
+        self, command: Awaitable[Any], refresh: bool = True, **expected: Any
+    ) -> None:
+        """Send a command and reconcile the device state afterwards.
+
+        In optimistic mode the expected attributes are shown right away and a
+        single deferred poll confirms them; otherwise the state is read back
+        immediately after the command. With refresh=False the caller takes
+        care of reading the state back.
+        """
+        self.coordinator.async_note_activity()
+        self._async_set_optimistic(**expected)
+        try:
+            await command
+            if refresh and not self._hub.optimistic:
+                await self._async_refresh_device()
+        except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+            raise HomeAssistantError(
+                f"Sending command to {self._device.label} failed: {err}"
+            ) from err
+        finally:
+            if refresh and self._hub.optimistic:
+                self._async_schedule_confirm()
+
+    @callback
+    def _async_set_optimistic(self, **expected: Any) -> None:
+        if not self._hub.optimistic or not expected:
+            return
+        for attr, value in expected.items():
+            setattr(self._device, attr, value)
+        self.async_write_ha_state()
+
+    def _confirm_delay(self) -> float:
+        return CONFIRM_DELAY
+
+    @callback
+    def _async_schedule_confirm(self) -> None:
+        self._async_cancel_confirm()
+        self._cancel_confirm = async_call_later(
+            self.hass, self._confirm_delay(), self._async_confirm_state
+        )
+
+    async def _async_confirm_state(self, _now: datetime) -> None:
+        self._cancel_confirm = None
+        try:
+            await self._async_refresh_device()
+        except (DaisyApiError, aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Confirming state of %s failed: %s", self.entity_id, err)
+
+    @callback
+    def _async_cancel_confirm(self) -> None:
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+            self._cancel_confirm = None
@@ -1,39 +1,443 @@
 from __future__ import annotations
-from homeassistant.core import HomeAssistant
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util.ssl import get_default_context
 
 from teleco_daisy import (
-    TelecoDaisy,
-    DaisyWhiteLight,
-    DaisyRGBLight,
-    DaisyAwningsCover,
-    DaisySlatsCover,
+    DaisyCover,
+    DaisyDevice,
+    DaisyInstallation,
+    DaisyLight,
+    DaisyRoom,
+    DaisyStatus,
 )
 
+from .api import (
+    AsyncTelecoDaisy,
+    DaisyApiError,
+    DaisyCircuitBreaker,
+    DaisyConnectionStats,
+    DaisyInventory,
+    DaisyRateLimiter,
+    DaisyRequestScheduler,
+    apply_status,
+    dump_room,
+)
+from .const import (
+    CONF_BULK_REFRESH,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_POOL_SIZE,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    DEFAULT_BULK_REFRESH,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DISCOVERY_CONCURRENCY,
+    DOMAIN,
+    KEEPALIVE_TIMEOUT,
+    STORAGE_VERSION,
+)
+from .coordinator import DaisyInstallationCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
 
-class DaisyHub(TelecoDaisy):
+class DaisyHub(AsyncTelecoDaisy):
     manufacturer = "Teleco Automation"
-    lights = []
-    covers = []
 
-    def __init__(self, hass: HomeAssistant, email: str, password: str) -> None:
-        super().__init__(email, password)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        email: str,
+        password: str,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        options = options or {}
+        self.setup_started = time.monotonic()
+        self.connection_stats = DaisyConnectionStats()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ssl=get_default_context(),
+            ),
+            trace_configs=[self.connection_stats.trace_config()],
+        )
+        super().__init__(
+            session,
+            email,
+            password,
+            DaisyRateLimiter(
+                rate=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                burst=options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+            ),
+            DaisyCircuitBreaker(on_change=self._async_set_online),
+        )
 
         self._hass = hass
         self._name = "Teleco DaisyHub"
         self._id = "Teleco DaisyHub".lower()
 
         self.online = True
+        self.optimistic = options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        self.bulk_refresh = options.get(CONF_BULK_REFRESH, DEFAULT_BULK_REFRESH)
+        # installations whose room-list payload turned out to carry no state
+        self._no_room_status: set[int] = set()
+        # installations whose state came with the latest discovery
+        self.seeded: set[int] = set()
+        self.min_scan_interval = timedelta(
+            seconds=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        )
+        self.max_scan_interval = timedelta(
+            seconds=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        )
+        self._entry_id = entry_id
+        self.signal_devices_added = f"{DOMAIN}_{entry_id}_devices_added"
+        self._session_store = session_store(hass, entry_id)
+        self._inventory_store = inventory_store(hass, entry_id)
+        self.inventory = DaisyInventory()
+        self.coordinators: dict[int, DaisyInstallationCoordinator] = {}
+        self.discovery_timings: dict[int, float] = {}
+        self.startup_timings: dict[str, float] = {}
+        self.suppressed_writes = 0
+        self.deferred = False
+        self._probe_lock = asyncio.Lock()
 
-    def fetch_entities(self):
-        self.lights = []
-        self.covers = []
-        for installation in self.get_account_installation_list():
-            for room in self.get_room_list(installation):
-                for device in room.deviceList:
-                    if isinstance(device, DaisyWhiteLight | DaisyRGBLight):
-                        self.lights += [device]
-                    elif isinstance(device, DaisyAwningsCover | DaisySlatsCover):
-                        self.covers += [device]
+    @property
+    def installations(self) -> list[DaisyInstallation]:
+        return self.inventory.installations
+
+    @property
+    def rooms(self) -> dict[int, list[DaisyRoom]]:
+        return self.inventory.rooms
+
+    @property
+    def lights(self) -> list[DaisyLight]:
+        return self.inventory.lights
+
+    @property
+    def covers(self) -> list[DaisyCover]:
+        return self.inventory.covers
+
+    @contextmanager
+    def startup_phase(self, name: str) -> Iterator[None]:
+        """Record how long a startup step takes in startup_timings."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.startup_timings[name] = round(time.monotonic() - start, 3)
+
+    def log_startup_timings(self) -> None:
+        self.startup_timings["ready"] = round(time.monotonic() - self.setup_started, 3)
+        _LOGGER.info(
+            "Teleco Daisy ready after %.3fs (%s)",
+            self.startup_timings["ready"],
+            ", ".join(
+                f"{name} {elapsed:.3f}s"
+                for name, elapsed in self.startup_timings.items()
+                if name != "ready"
+            ),
+        )
+
+    @callback
+    def _async_set_online(self, online: bool) -> None:
+        if online:
+            _LOGGER.info("Daisy cloud is reachable again")
+        else:
+            _LOGGER.warning(
+                "Daisy cloud unreachable after %d consecutive failures, "
+                "suspending polling",
+                self.circuit_breaker.failures,
+            )
+        self.online = online
+        for coordinator in self.coordinators.values():
+            coordinator.async_update_listeners()
+
+    async def async_probe(self) -> bool:
+        """Cheap request used instead of polling while the cloud is down."""
+        async with self._probe_lock:
+            if self.online:
+                return True
+            try:
+                await self.async_get_account_installation_list()
+            except (DaisyApiError, aiohttp.ClientError, TimeoutError):
+                return False
+            return self.online
+
+    async def async_restore_session(self) -> None:
+        """Reuse the stored session token, or log in if there is none.
+
+        A token the cloud no longer accepts is replaced transparently by the
+        re-login in _async_post on the first request.
+        """
+        data = await self._session_store.async_load()
+        if data and data.get("email") == self.email:
+            self.idAccount = data["idAccount"]
+            self.idSession = data["idSession"]
+            return
+        await self.async_login()
+
+    async def async_login(self) -> None:
+        await super().async_login()
+        await self._session_store.async_save(
+            {
+                "email": self.email,
+                "idAccount": self.idAccount,
+                "idSession": self.idSession,
+            }
+        )
+
+    async def async_fetch_entities(self) -> None:
+        inventory, statuses = await self.async_discover()
+        self._apply_inventory(inventory)
+        self._seed_states(statuses)
+        await self._async_save_inventory(inventory)
+
+    async def async_load_cached_entities(self) -> bool:
+        """Populate the device lists from the stored inventory, if any.
+
+        A cache that no longer parses (e.g. written by an older version of the
+        models) is dropped, and setup falls back to a cold discovery.
+        """
+        try:
+            data = await self._inventory_store.async_load()
+            if not data:
+                return False
+            inventory = []
+            for cached in data["installations"]:
+                installation = DaisyInstallation(**cached["installation"])
+                inventory += [
+                    (installation, self.build_rooms(installation, cached["rooms"]))
+                ]
+        except (KeyError, TypeError, ValueError, NotImplementedError) as err:
+            # pydantic's ValidationError is a ValueError; NotImplementedError
+            # is what Store raises for a version it cannot migrate
+            _LOGGER.warning("Discarding unreadable Daisy inventory cache: %r", err)
+            await self._inventory_store.async_remove()
+            return False
+        self._apply_inventory(inventory)
+        return True
+
+    async def async_update_inventory(self, refresh_added: bool = True) -> None:
+        """Rediscover the account and apply the difference in place.
+
+        Devices are matched by idInstallationDevice: known ones keep their
+        model (and entity), new ones are announced on signal_devices_added and
+        vanished ones are dropped from the device registry, which removes
+        their entities as well. The installations of new devices are
+        refreshed unless refresh_added is False, for callers that refresh
+        every installation themselves afterwards.
+        """
+        inventory, statuses = await self.async_discover()
+        await self._async_save_inventory(inventory)
+
+        known = self.inventory.devices
+        for _, rooms in inventory:
+            for room in rooms:
+                room.deviceList = [
+                    known.get(device.idInstallationDevice, device)
+                    for device in room.deviceList
+                ]
+        self._apply_inventory(inventory)
+        self._seed_states(statuses)
+
+        current = self.inventory.devices
+        added = [device for id_, device in current.items() if id_ not in known]
+        removed = [id_ for id_ in known if id_ not in current]
+
+        for installation in self.installations:
+            if installation.idInstallation not in self.coordinators:
+                self.coordinators[installation.idInstallation] = (
+                    DaisyInstallationCoordinator(self._hass, self, installation)
+                )
+        for id_installation in list(self.coordinators):
+            if id_installation not in self.rooms:
+                del self.coordinators[id_installation]
+
+        if removed:
+            _LOGGER.info("Removing vanished Daisy devices %s", removed)
+            device_registry = dr.async_get(self._hass)
+            for id_ in removed:
+                if device := device_registry.async_get_device(
+                    identifiers={(DOMAIN, str(id_))}
+                ):
+                    device_registry.async_update_device(
+                        device.id, remove_config_entry_id=self._entry_id
+                    )
+        for id_installation in self.seeded:
+            self.coordinators[id_installation].async_update_listeners()
+        if added:
+            _LOGGER.info("Adding new Daisy devices %s", [str(d) for d in added])
+            async_dispatcher_send(self._hass, self.signal_devices_added, added)
+            if refresh_added:
+                await asyncio.gather(
+                    *(
+                        coordinator.async_request_refresh()
+                        for coordinator in {
+                            self.coordinator_for(device) for device in added
+                        }
+                        if coordinator.installation.idInstallation not in self.seeded
+                    )
+                )
+
+    async def async_discover(
+        self,
+    ) -> tuple[
+        list[tuple[DaisyInstallation, list[DaisyRoom]]], dict[int, list[DaisyStatus]]
+    ]:
+        """Fetch the inventory and any device states the room lists carry."""
+        installations = await self.async_get_account_installation_list()
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+        statuses: dict[int, list[DaisyStatus]] = {}
+
+        async def _async_rooms(installation: DaisyInstallation) -> list[DaisyRoom]:
+            async with semaphore:
+                start = time.monotonic()
+                rooms, room_statuses = await self.async_get_room_list_with_status(
+                    installation
+                )
+                elapsed = time.monotonic() - start
+            statuses.update(room_statuses)
+            self.discovery_timings[installation.idInstallation] = elapsed
+            _LOGGER.debug(
+                "Discovered %d rooms of %s in %.3fs",
+                len(rooms),
+                installation.instDescription,
+                elapsed,
+            )
+            return rooms
+
+        rooms = await asyncio.gather(*map(_async_rooms, installations))
+        return list(zip(installations, rooms)), statuses
+
+    def _seed_states(self, statuses: dict[int, list[DaisyStatus]]) -> None:
+        """Apply the device states that came with the discovery payload.
+
+        Installations whose devices all got their state this way are recorded
+        in seeded and need no refresh of their own.
+        """
+        self.seeded = set()
+        for installation in self.installations:
+            devices = self.devices_for_installation(installation)
+            for device in devices:
+                if stati := statuses.get(device.idInstallationDevice):
+                    apply_status(device, stati)
+            seeded = [d for d in devices if d.idInstallationDevice in statuses]
+            if len(seeded) == len(devices):
+                self.seeded.add(installation.idInstallation)
+            elif not seeded:
+                # no point in asking the room list for state when polling
+                self._no_room_status.add(installation.idInstallation)
+
+    def _apply_inventory(
+        self, inventory: list[tuple[DaisyInstallation, list[DaisyRoom]]]
+    ) -> None:
+        self.inventory = DaisyInventory(inventory)
+
+    async def _async_save_inventory(
+        self, inventory: list[tuple[DaisyInstallation, list[DaisyRoom]]]
+    ) -> None:
+        await self._inventory_store.async_save(
+            {"installations": _dump_inventory(inventory)}
+        )
+
+    async def async_refresh_installation(
+        self, installation: DaisyInstallation
+    ) -> list[list[DaisyStatus] | BaseException]:
+        """Refresh the state of every device of an installation.
+
+        In bulk mode the states are taken from a single room-list request;
+        only devices it carries no state for are read one by one. Returns the
+        results of those individual reads, exceptions included.
+        """
+        devices = self.devices_for_installation(installation)
+        if (
+            self.bulk_refresh
+            and installation.idInstallation not in self._no_room_status
+        ):
+            statuses = await self.scheduler(installation).async_run(
+                DaisyRequestScheduler.POLL,
+                lambda: self.async_room_status(installation),
+            )
+            if not statuses:
+                _LOGGER.debug(
+                    "Room list of %s carries no device state, reading devices "
+                    "individually from now on",
+                    installation.instDescription,
+                )
+                self._no_room_status.add(installation.idInstallation)
+            missing = []
+            for device in devices:
+                if stati := statuses.get(device.idInstallationDevice):
+                    apply_status(device, stati)
+                else:
+                    missing += [device]
+            devices = missing
+        return await asyncio.gather(
+            *(self.async_update_state(device) for device in devices),
+            return_exceptions=True,
+        )
+
+    def device(self, id_installation_device: int) -> DaisyDevice | None:
+        return self.inventory.devices.get(id_installation_device)
+
+    def devices_for_installation(
+        self, installation: DaisyInstallation
+    ) -> list[DaisyDevice]:
+        return self.inventory.by_installation.get(installation.idInstallation, [])
+
+    def devices_for_room(self, room: DaisyRoom) -> list[DaisyDevice]:
+        return self.inventory.by_room.get(room.idInstallationRoom, [])
+
+    def create_coordinators(self) -> None:
+        self.coordinators = {
+            installation.idInstallation: DaisyInstallationCoordinator(
+                self._hass, self, installation
+            )
+            for installation in self.installations
+        }
+
+    async def async_setup_coordinators(self) -> None:
+        self.create_coordinators()
+        # installations are polled independently, so refresh them side by side
+        await asyncio.gather(
+            *(
+                coordinator.async_config_entry_first_refresh()
+                for id_installation, coordinator in self.coordinators.items()
+                if id_installation not in self.seeded
+            )
+        )
+
+    def coordinator_for(self, device: DaisyDevice) -> DaisyInstallationCoordinator:
+        return self.coordinators[device.installation.idInstallation]
+
+    async def async_close(self) -> None:
+        self.cancel_state_reads()
+        if self._session.closed:
+            return
+        _LOGGER.debug("Closing Daisy session: %s", self.connection_stats.as_dict())
+        await self._session.close()
 
     @property
     def hub_id(self) -> str:
@@ -42,3 +446,23 @@ class DaisyHub(TelecoDaisy):
     async def test_connection(self) -> bool:
         # TODO
         return True
+
+
+def session_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.session")
+
+
+def inventory_store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.inventory")
+
+
+def _dump_inventory(
+    inventory: list[tuple[DaisyInstallation, list[DaisyRoom]]],
+) -> list[dict]:
+    return [
+        {
+            "installation": installation.model_dump(),
+            "rooms": [dump_room(room) for room in rooms],
+        }
+        for installation, rooms in inventory
+    ]
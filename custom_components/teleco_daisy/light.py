@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Optional
 
 from homeassistant.util.color import value_to_brightness, brightness_to_value
 
-from .const import DOMAIN
+from .const import CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE, DOMAIN
 
 from homeassistant import config_entries, core
+from homeassistant.const import STATE_ON
+from homeassistant.exceptions import HomeAssistantError
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -16,9 +19,12 @@ from homeassistant.components.light import (
     LightEntityDescription,
     ATTR_RGB_COLOR,
 )
-from teleco_daisy import DaisyWhiteLight, DaisyRGBLight
+from teleco_daisy import DaisyDevice, DaisyWhiteLight, DaisyRGBLight
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.device_registry import DeviceInfo
+
+from .coordinator import DaisyInstallationCoordinator
+from .entity import TelecoDaisyEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,24 +37,44 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     hub = hass.data[DOMAIN][config_entry.entry_id]
+    command_debounce = config_entry.options.get(
+        CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE
+    )
 
-    if config_entry.options:
-        hub.update(config_entry.options)
+    @core.callback
+    def _async_add_lights(devices: list[DaisyDevice]) -> None:
+        async_add_entities(
+            TelecoDaisyLight(hub.coordinator_for(light), light, command_debounce)
+            for light in devices
+            if isinstance(light, DaisyWhiteLight | DaisyRGBLight)
+        )
 
-    async_add_entities(TelecoDaisyLight(light) for light in hub.lights)
+    _async_add_lights(hub.lights)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, hub.signal_devices_added, _async_add_lights)
+    )
 
 
-class TelecoDaisyLight(LightEntity):
+class TelecoDaisyLight(TelecoDaisyEntity, LightEntity):
     entity_description = LightEntityDescription(
         key="teleco_daisy_light", has_entity_name=True, name=None
     )
 
-    def __init__(self, light: DaisyWhiteLight | DaisyRGBLight) -> None:
+    def __init__(
+        self,
+        coordinator: DaisyInstallationCoordinator,
+        light: DaisyWhiteLight | DaisyRGBLight,
+        command_debounce: float = DEFAULT_COMMAND_DEBOUNCE,
+    ) -> None:
+        super().__init__(coordinator, light)
         self._light = light
         self._name = self._light.label
 
-        self._attr_unique_id = str(self._light.idInstallationDevice)
-        self._attr_name = self._light.label
+        self._command_debounce = command_debounce
+        # (rgb, brightness 1-100) waiting to be sent; newer calls overwrite it
+        self._pending: tuple[tuple[int, int, int] | None, int] | None = None
+        self._sending = False
+        self._trailing: asyncio.Task[None] | None = None
 
         if isinstance(light, DaisyRGBLight):
             self._attr_color_mode = ColorMode.RGB
@@ -58,14 +84,6 @@ class TelecoDaisyLight(LightEntity):
             self._attr_color_mode = ColorMode.BRIGHTNESS
             self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._attr_unique_id)},
-            name=self._attr_name,
-            manufacturer="Teleco Automation",
-        )
-
     @property
     def name(self) -> str:
         return self._name
@@ -89,26 +107,88 @@ class TelecoDaisyLight(LightEntity):
             return self._light.rgb or (255, 255, 255)
         return None
 
-    def turn_on(self, **kwargs: Any) -> None:
-        if new_rgb := kwargs.get(ATTR_RGB_COLOR):
-            rgb_col = (int(new_rgb[0]), int(new_rgb[1]), int(new_rgb[2]))
+    def _restore_state(self, state: core.State) -> None:
+        self._light.is_on = state.state == STATE_ON
+        if (brightness := state.attributes.get(ATTR_BRIGHTNESS)) is not None:
+            self._light.brightness = round(
+                brightness_to_value(BRIGHTNESS_SCALE, brightness)
+            )
+        if isinstance(self._light, DaisyRGBLight) and (
+            rgb := state.attributes.get(ATTR_RGB_COLOR)
+        ):
+            self._light.rgb = tuple(rgb)
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._trailing is not None:
+            self._trailing.cancel()
+        await super().async_will_remove_from_hass()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        if self._pending is not None:
+            rgb_col, brightness = self._pending
         else:
             rgb_col = self.rgb_color
+            brightness = int(brightness_to_value(BRIGHTNESS_SCALE, self.brightness))
+
+        if new_rgb := kwargs.get(ATTR_RGB_COLOR):
+            rgb_col = (int(new_rgb[0]), int(new_rgb[1]), int(new_rgb[2]))
 
         if new_bright := kwargs.get(ATTR_BRIGHTNESS):
-            brightness = int(new_bright)
-        else:
-            brightness = self.brightness
+            brightness = int(brightness_to_value(BRIGHTNESS_SCALE, int(new_bright)))
 
-        self._light.set_rgb_and_brightness(
-            rgb=rgb_col,
-            brightness=int(brightness_to_value(BRIGHTNESS_SCALE, brightness)),
+        # bursts (e.g. dragging a slider) collapse into one trailing command
+        # carrying the last requested values
+        self._pending = (rgb_col, brightness)
+        if rgb_col is not None:
+            self._async_set_optimistic(is_on=True, brightness=brightness, rgb=rgb_col)
+        else:
+            self._async_set_optimistic(is_on=True, brightness=brightness)
+        if self._sending:
+            # picked up by the trailing send once the current window is over
+            return
+        self._sending = True
+        try:
+            await self._async_send_pending()
+        except BaseException:
+            self._sending = False
+            raise
+        self._trailing = self.hass.async_create_background_task(
+            self._async_send_trailing(), f"{self.entity_id} trailing command"
         )
-        self._light.update_state()
 
-    def turn_off(self, **kwargs: Any) -> None:
-        self._light.turn_off()
-        self._light.update_state()
-
-    def update(self) -> None:
-        self._light.update_state()
+    async def _async_send_pending(self) -> None:
+        if (pending := self._pending) is None:
+            return
+        rgb_col, brightness = pending
+        await self._async_send(
+            self._hub.async_set_rgb_and_brightness(
+                self._light, rgb=rgb_col, brightness=brightness
+            )
+        )
+        # only clear what was sent; a newer call may have replaced it meanwhile
+        if self._pending is pending:
+            self._pending = None
+
+    async def _async_send_trailing(self) -> None:
+        """Send the latest pending values once per window until none are left.
+
+        Calls arriving while a command is in flight or during the window after
+        it only replace _pending, so the last requested values always go out.
+        """
+        try:
+            while True:
+                await asyncio.sleep(self._command_debounce)
+                if self._pending is None:
+                    return
+                try:
+                    await self._async_send_pending()
+                except HomeAssistantError as err:
+                    _LOGGER.warning("%s", err)
+                    return
+        finally:
+            self._sending = False
+            self._trailing = None
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        self._pending = None
+        await self._async_send(self._hub.async_turn_off(self._light), is_on=False)
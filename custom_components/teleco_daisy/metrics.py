@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .api import LATENCY_BUCKETS
+from .const import DOMAIN
+from .hub import DaisyHub
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class DaisyMetricsView(HomeAssistantView):
+    """Hub metrics of every config entry in the Prometheus text format."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        hubs: dict[str, DaisyHub] = hass.data.get(DOMAIN, {})
+        return web.Response(
+            body=render_metrics(hubs).encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+
+class _Family:
+    def __init__(self, name: str, kind: str, doc: str) -> None:
+        self.name = f"{DOMAIN}_{name}"
+        self.kind = kind
+        self.doc = doc
+        self.samples: list[str] = []
+
+    def add(self, value: float, suffix: str = "", **labels: str) -> None:
+        label_text = ",".join(
+            f'{key}="{_escape(str(val))}"' for key, val in labels.items()
+        )
+        self.samples.append(f"{self.name}{suffix}{{{label_text}}} {float(value)!r}")
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.doc}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(hubs: dict[str, DaisyHub]) -> str:
+    online = _Family("online", "gauge", "Whether the Daisy cloud is reachable.")
+    duration = _Family(
+        "request_duration_seconds", "histogram", "Daisy cloud request latency."
+    )
+    errors = _Family("request_errors_total", "counter", "Failed Daisy cloud requests.")
+    requests = _Family(
+        "requests_total", "counter", "HTTP requests sent, including retries."
+    )
+    retries = _Family(
+        "request_retries_total", "counter", "Requests retried after throttling."
+    )
+    delayed = _Family(
+        "rate_limit_delayed_total", "counter", "Requests held back by the limiter."
+    )
+    delay = _Family(
+        "rate_limit_delay_seconds_total", "counter", "Time spent in the limiter."
+    )
+    pending = _Family(
+        "pending_requests", "gauge", "Requests waiting for or awaiting a response."
+    )
+    breaker_open = _Family(
+        "circuit_breaker_open", "gauge", "Whether the circuit breaker is open."
+    )
+    breaker_trips = _Family(
+        "circuit_breaker_trips_total", "counter", "Times the circuit breaker opened."
+    )
+    created = _Family("connections_created_total", "counter", "New pooled connections.")
+    reused = _Family(
+        "connections_reused_total", "counter", "Requests served by a pooled connection."
+    )
+    shared = _Family(
+        "state_reads_shared_total",
+        "counter",
+        "State reads answered by an identical read already in flight.",
+    )
+    suppressed = _Family(
+        "suppressed_state_writes_total",
+        "counter",
+        "Entity state writes skipped because the device state was unchanged.",
+    )
+    queue_depth = _Family(
+        "queue_depth", "gauge", "Requests waiting for their installation's turn."
+    )
+    scheduled = _Family(
+        "scheduled_requests_total", "counter", "Requests run per installation."
+    )
+    poll = _Family(
+        "poll_duration_seconds", "summary", "Duration of installation poll cycles."
+    )
+    last_poll = _Family(
+        "last_poll_duration_seconds", "gauge", "Duration of the latest poll cycle."
+    )
+
+    for entry_id, hub in hubs.items():
+        online.add(hub.online, entry=entry_id)
+        for endpoint, latency in hub.latency.endpoints.items():
+            for bound, count in zip(LATENCY_BUCKETS, latency.buckets, strict=True):
+                duration.add(
+                    count, "_bucket", entry=entry_id, endpoint=endpoint, le=str(bound)
+                )
+            duration.add(
+                latency.count, "_bucket", entry=entry_id, endpoint=endpoint, le="+Inf"
+            )
+            duration.add(latency.total, "_sum", entry=entry_id, endpoint=endpoint)
+            duration.add(latency.count, "_count", entry=entry_id, endpoint=endpoint)
+            errors.add(latency.errors, entry=entry_id, endpoint=endpoint)
+        requests.add(hub.rate_limiter.requests, entry=entry_id)
+        retries.add(hub.rate_limiter.retries, entry=entry_id)
+        delayed.add(hub.rate_limiter.delayed, entry=entry_id)
+        delay.add(hub.rate_limiter.delay_total, entry=entry_id)
+        pending.add(hub.pending_requests, entry=entry_id)
+        breaker_open.add(hub.circuit_breaker.is_open, entry=entry_id)
+        breaker_trips.add(hub.circuit_breaker.trips, entry=entry_id)
+        created.add(hub.connection_stats.created, entry=entry_id)
+        reused.add(hub.connection_stats.reused, entry=entry_id)
+        shared.add(hub.state_reads_shared, entry=entry_id)
+        suppressed.add(hub.suppressed_writes, entry=entry_id)
+        for coordinator in hub.coordinators.values():
+            installation = coordinator.installation.instDescription
+            scheduler = hub.scheduler(coordinator.installation)
+            queue_depth.add(scheduler.depth, entry=entry_id, installation=installation)
+            for kind, count in (
+                ("command", scheduler.commands),
+                ("poll", scheduler.polls),
+            ):
+                scheduled.add(
+                    count, entry=entry_id, installation=installation, kind=kind
+                )
+            poll.add(
+                coordinator.poll_duration_total,
+                "_sum",
+                entry=entry_id,
+                installation=installation,
+            )
+            poll.add(
+                coordinator.polls, "_count", entry=entry_id, installation=installation
+            )
+            if coordinator.last_poll_duration is not None:
+                last_poll.add(
+                    coordinator.last_poll_duration,
+                    entry=entry_id,
+                    installation=installation,
+                )
+
+    families = (
+        online,
+        duration,
+        errors,
+        requests,
+        retries,
+        delayed,
+        delay,
+        pending,
+        breaker_open,
+        breaker_trips,
+        created,
+        reused,
+        shared,
+        suppressed,
+        queue_depth,
+        scheduled,
+        poll,
+        last_poll,
+    )
+    return "\n".join(line for family in families for line in family.render()) + "\n"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.components.cover import ATTR_POSITION
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .const import DOMAIN, SERVICE_SET_COVERS, SET_COVERS_CONCURRENCY
+from .cover import TelecoDaisyCover
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_COVERS_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_POSITION): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    async def _async_set_covers(call: ServiceCall) -> None:
+        await async_set_covers(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_COVERS, _async_set_covers, schema=SET_COVERS_SCHEMA
+    )
+
+
+async def async_set_covers(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Move many covers at once and refresh their installations a single time.
+
+    Commands are sent with at most SET_COVERS_CONCURRENCY in flight (the
+    installation schedulers serialize them per installation regardless). The
+    refresh is scheduled for the longest predicted travel time of the moved
+    covers.
+    """
+    entity_ids = await async_extract_entity_ids(hass, call)
+    covers = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity_id, entity in platform.entities.items()
+        if entity_id in entity_ids and isinstance(entity, TelecoDaisyCover)
+    ]
+    if not covers:
+        raise HomeAssistantError(
+            f"No Teleco Daisy covers among {', '.join(sorted(entity_ids))}"
+        )
+
+    semaphore = asyncio.Semaphore(SET_COVERS_CONCURRENCY)
+
+    async def _async_move(cover: TelecoDaisyCover) -> None:
+        async with semaphore:
+            await cover.async_move_to(call.data[ATTR_POSITION], refresh=False)
+
+    results = await asyncio.gather(*map(_async_move, covers), return_exceptions=True)
+
+    coordinators = {cover.coordinator for cover in covers}
+    for coordinator in coordinators:
+        coordinator.async_note_activity()
+
+    async def _async_refresh(_now: datetime) -> None:
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+
+    # read back once the slowest cover should have arrived, not mid-travel
+    async_call_later(
+        hass, max(cover._confirm_delay() for cover in covers), _async_refresh
+    )
+
+    failed = []
+    for cover, result in zip(covers, results, strict=True):
+        if isinstance(result, HomeAssistantError):
+            _LOGGER.warning("Moving %s failed: %s", cover.entity_id, result)
+            failed += [cover.entity_id]
+        elif isinstance(result, BaseException):
+            raise result
+    if failed:
+        raise HomeAssistantError(f"Moving {', '.join(failed)} failed")